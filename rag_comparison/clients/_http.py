@@ -0,0 +1,85 @@
+"""Shared aiohttp sessions for HTTP-based RAG clients."""
+
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+
+# aiohttp sessions and connectors are bound to the event loop they were
+# created on, so the shared instances are kept per loop.
+_connectors: dict[asyncio.AbstractEventLoop, aiohttp.TCPConnector] = {}
+_sessions: dict[
+    tuple[asyncio.AbstractEventLoop, frozenset[tuple[str, str]]], aiohttp.ClientSession
+] = {}
+
+# Pool limits for new connectors, see configure_pool()
+_pool_limit = 16
+_pool_limit_per_host = 8
+
+
+def configure_pool(parallel_workers: int) -> None:
+    """Size the shared connection pool for the harness's concurrency.
+
+    Allows one connection per worker to each host, and twice that in
+    total. Applies to connectors created after the call.
+
+    Args:
+        parallel_workers: Number of queries expected to run at once.
+    """
+    global _pool_limit, _pool_limit_per_host
+    _pool_limit_per_host = max(parallel_workers, 1)
+    _pool_limit = _pool_limit_per_host * 2
+
+
+def _get_connector(loop: asyncio.AbstractEventLoop) -> aiohttp.TCPConnector:
+    """Get or create the connection pool shared by all sessions on a loop."""
+    connector = _connectors.get(loop)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            limit=_pool_limit,
+            limit_per_host=_pool_limit_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+        _connectors[loop] = connector
+    return connector
+
+
+async def get_shared_session(headers: dict[str, str]) -> aiohttp.ClientSession:
+    """Get the shared session for a set of default headers.
+
+    Clients sending the same headers (e.g. the same API key) reuse one
+    session, and all sessions share one connection pool, so keep-alive
+    connections and TLS handshakes are reused across client instances.
+
+    Args:
+        headers: Default headers sent with every request on the session.
+
+    Returns:
+        An open aiohttp session bound to the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    key = (loop, frozenset(headers.items()))
+    session = _sessions.get(key)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=_get_connector(loop),
+            connector_owner=False,
+            headers=headers,
+        )
+        _sessions[key] = session
+    return session
+
+
+async def close_shared_sessions() -> None:
+    """Close all shared sessions and the connection pool of the running loop."""
+    loop = asyncio.get_running_loop()
+    for key in [k for k in _sessions if k[0] is loop]:
+        session = _sessions.pop(key)
+        if not session.closed:
+            await session.close()
+
+    connector = _connectors.pop(loop, None)
+    if connector is not None and not connector.closed:
+        await connector.close()
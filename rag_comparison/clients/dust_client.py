@@ -3,16 +3,34 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import random
 import time
-from typing import Optional
+from typing import Any, Optional
 
 import aiohttp
+import orjson
+from aiohttp.http_exceptions import LineTooLong
 
+from rag_comparison.clients._http import get_shared_session
 from rag_comparison.clients.base import QueryResult, RAGClient
 from rag_comparison.errors import DustAPIError
 
 
+def _elapsed_ms(start_time: float) -> float:
+    """Milliseconds elapsed since a time.perf_counter() reading."""
+    return (time.perf_counter() - start_time) * 1000
+
+
+def _get_path(data: dict, path: str) -> Any:
+    """Look up a dotted key path (e.g. 'conversation.sId') in nested dicts."""
+    value: Any = data
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
 class DustClient(RAGClient):
     """Client for Dust Conversations API.
 
@@ -22,12 +40,19 @@ class DustClient(RAGClient):
 
     BASE_URL = "https://dust.tt/api/v1"
 
+    SSE_READ_BUFSIZE = 2**20
+    """Read buffer for the events stream; a single event may be up to twice this."""
+
     def __init__(
         self,
         api_key: str,
         workspace_id: str,
         agent_id: str = "beTfWHdTC6",
         timeout: float = 30.0,
+        initial_poll_interval: float = 0.05,
+        max_poll_interval: float = 2.0,
+        poll_backoff: float = 1.5,
+        raw_response_fields: Optional[tuple[str, ...]] = ("conversation.sId", "message.sId"),
     ) -> None:
         """Initialize Dust client.
 
@@ -36,33 +61,64 @@ class DustClient(RAGClient):
             workspace_id: Dust workspace ID.
             agent_id: Agent configuration ID (default: beTfWHdTC6).
             timeout: Request timeout in seconds.
+            initial_poll_interval: First delay between conversation polls, in seconds.
+            max_poll_interval: Upper bound on the delay between polls, in seconds.
+            poll_backoff: Factor applied to the poll delay after each miss.
+            raw_response_fields: Dotted paths kept from the API response in
+                QueryResult.raw_response. None keeps the full payload.
         """
         self.api_key = api_key
         self.workspace_id = workspace_id
         self.agent_id = agent_id
         self.timeout = timeout
-        self._session: Optional[aiohttp.ClientSession] = None
+        self.initial_poll_interval = initial_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.poll_backoff = poll_backoff
+        self.raw_response_fields = raw_response_fields
+        self._request_timeout = aiohttp.ClientTimeout(total=timeout)
+
+        # Only the question varies between conversation payloads, so the rest
+        # is serialized once and the question is spliced in by _build_payload().
+        message_rest = orjson.dumps({
+            "mentions": [{"configurationId": self.agent_id}],
+            "context": {
+                "timezone": "Europe/Paris",
+                "username": "api-user",
+                "profilePictureUrl": None,
+            },
+        })
+        payload_rest = orjson.dumps({"visibility": "unlisted", "title": None})
+        self._payload_head = b'{"message":{"content":'
+        self._payload_tail = b"," + message_rest[1:] + b"," + payload_rest[1:]
 
     @property
     def system_name(self) -> str:
         return "dust"
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-            )
-        return self._session
+        """Get the shared aiohttp session for this API key."""
+        return await get_shared_session({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        })
 
     async def close(self) -> None:
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Release the client.
+
+        The HTTP session is shared between clients and closed once by
+        close_shared_sessions() at harness teardown.
+        """
+
+    def _build_payload(self, question: str) -> bytes:
+        """Serialize the create-conversation payload for a question.
+
+        Args:
+            question: The legal question to ask.
+
+        Returns:
+            JSON request body.
+        """
+        return self._payload_head + orjson.dumps(question) + self._payload_tail
 
     async def query(self, question: str) -> QueryResult:
         """Query Dust agent and collect SSE response.
@@ -85,56 +141,121 @@ class DustClient(RAGClient):
             session = await self._get_session()
             url = f"{self.BASE_URL}/w/{self.workspace_id}/assistant/conversations"
 
-            payload = {
-                "message": {
-                    "content": question,
-                    "mentions": [{"configurationId": self.agent_id}],
-                    "context": {
-                        "timezone": "Europe/Paris",
-                        "username": "api-user",
-                        "profilePictureUrl": None,
-                    },
-                },
-                "visibility": "unlisted",
-                "title": None,
-            }
-
-            async with session.post(url, json=payload) as response:
-                latency_ms = (time.perf_counter() - start_time) * 1000
-
+            async with session.post(
+                url, data=self._build_payload(question), timeout=self._request_timeout
+            ) as response:
                 if response.status != 200:
                     error_text = await response.text()
                     raise DustAPIError(response.status, error_text)
 
                 # Parse JSON response (Dust returns conversation data, not SSE for initial call)
-                data = await response.json()
+                data = orjson.loads(await response.read())
 
-                # Extract conversation ID for follow-up
-                conversation = data.get("conversation", {})
-                conversation_id = conversation.get("sId")
+            # Extract conversation ID for follow-up
+            conversation = data.get("conversation", {})
+            conversation_id = conversation.get("sId")
 
-                if not conversation_id:
-                    return QueryResult.error("No conversation ID in response", latency_ms)
+            if not conversation_id:
+                return QueryResult.error("No conversation ID in response", _elapsed_ms(start_time))
 
-                # Poll for agent response
+            # Stream the agent message events, polling only if streaming is unavailable
+            answer = None
+            message_id = self._find_agent_message_id(conversation)
+            if message_id:
+                answer = await self._stream_response(
+                    session, conversation_id, message_id, start_time
+                )
+            if answer is None:
                 answer = await self._poll_for_response(session, conversation_id, start_time)
-                final_latency = (time.perf_counter() - start_time) * 1000
 
-                return QueryResult(
-                    answer=answer,
-                    latency_ms=final_latency,
-                    status="success",
-                    raw_response=data,
-                )
+            return QueryResult(
+                answer=answer,
+                latency_ms=_elapsed_ms(start_time),
+                status="success",
+                raw_response=self._prune_raw_response(data),
+            )
 
         except asyncio.TimeoutError:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            return QueryResult.timeout(latency_ms)
+            return QueryResult.timeout(_elapsed_ms(start_time))
         except DustAPIError:
             raise
         except Exception as e:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            return QueryResult.error(str(e), latency_ms)
+            return QueryResult.error(str(e), _elapsed_ms(start_time))
+
+    def _prune_raw_response(self, data: dict) -> dict:
+        """Keep only the configured fields of a Dust API response.
+
+        The full conversation payload can be tens of KB; keeping it on every
+        QueryResult adds up over a whole experiment.
+
+        Args:
+            data: Parsed create-conversation response.
+
+        Returns:
+            The selected fields keyed by path, or data itself if no fields are set.
+        """
+        if self.raw_response_fields is None:
+            return data
+        return {path: _get_path(data, path) for path in self.raw_response_fields}
+
+    @staticmethod
+    def _find_agent_message_id(conversation: dict) -> Optional[str]:
+        """Find the sId of the agent message in a conversation payload.
+
+        Args:
+            conversation: Conversation object returned by the Dust API.
+
+        Returns:
+            The agent message sId, or None if the agent has not replied yet.
+        """
+        for item in conversation.get("content", []):
+            if isinstance(item, list):
+                for msg in item:
+                    if msg.get("type") == "agent_message":
+                        return msg.get("sId")
+        return None
+
+    async def _stream_response(
+        self,
+        session: aiohttp.ClientSession,
+        conversation_id: str,
+        message_id: str,
+        start_time: float,
+    ) -> Optional[str]:
+        """Stream agent message events over SSE until the answer is complete.
+
+        Args:
+            session: Active aiohttp session.
+            conversation_id: Dust conversation ID.
+            message_id: Agent message sId to follow.
+            start_time: Query start time for timeout calculation.
+
+        Returns:
+            Aggregated response text, or None if the events endpoint is not
+            available or the stream ended early, and the caller should fall
+            back to polling.
+        """
+        url = (
+            f"{self.BASE_URL}/w/{self.workspace_id}/assistant/conversations/"
+            f"{conversation_id}/messages/{message_id}/events"
+        )
+        remaining = self.timeout - (time.perf_counter() - start_time)
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+
+        async with session.get(
+            url,
+            headers={"Accept": "text/event-stream"},
+            timeout=aiohttp.ClientTimeout(total=remaining, sock_read=remaining),
+            # The final event carries the whole agent message, one event must fit
+            read_bufsize=self.SSE_READ_BUFSIZE,
+        ) as response:
+            if response.status in (404, 406):
+                return None
+            if response.status != 200:
+                error_text = await response.text()
+                raise DustAPIError(response.status, error_text)
+            return await self._parse_sse_stream(response)
 
     async def _poll_for_response(
         self,
@@ -144,6 +265,10 @@ class DustClient(RAGClient):
     ) -> str:
         """Poll conversation for agent message completion.
 
+        The delay between polls starts short so fast answers are picked up
+        quickly, then grows exponentially (with jitter) up to
+        max_poll_interval. Rate-limit responses jump straight to the maximum.
+
         Args:
             session: Active aiohttp session.
             conversation_id: Dust conversation ID.
@@ -153,79 +278,103 @@ class DustClient(RAGClient):
             Aggregated response text from the agent.
         """
         url = f"{self.BASE_URL}/w/{self.workspace_id}/assistant/conversations/{conversation_id}"
-        poll_interval = 0.5  # seconds
-        max_polls = int(self.timeout / poll_interval)
+        interval = self.initial_poll_interval
 
-        for _ in range(max_polls):
-            elapsed = time.perf_counter() - start_time
-            if elapsed >= self.timeout:
+        while True:
+            # Each GET may only use what is left of the query's timeout budget
+            remaining = self.timeout - (time.perf_counter() - start_time)
+            if remaining <= 0:
                 raise asyncio.TimeoutError()
 
-            async with session.get(url) as response:
-                if response.status != 200:
-                    continue
-
-                data = await response.json()
-                conversation = data.get("conversation", {})
-                content = conversation.get("content", [])
-
-                # Look for completed agent message
-                for item in content:
-                    if isinstance(item, list):
-                        for msg in item:
-                            if msg.get("type") == "agent_message":
-                                status = msg.get("status")
-                                if status == "succeeded":
-                                    return msg.get("content", "")
-                                elif status == "failed":
-                                    error = msg.get("error", {})
-                                    raise DustAPIError(500, error.get("message", "Agent failed"))
-
-            await asyncio.sleep(poll_interval)
-
-        raise asyncio.TimeoutError()
-
-    async def _parse_sse_stream(self, response: aiohttp.ClientResponse) -> str:
+            async with session.get(
+                url, timeout=aiohttp.ClientTimeout(total=max(remaining, 0.1))
+            ) as response:
+                if response.status in (429, 503):
+                    interval = self.max_poll_interval
+                elif response.status == 200:
+                    data = orjson.loads(await response.read())
+                    conversation = data.get("conversation", {})
+                    content = conversation.get("content", [])
+
+                    # Look for completed agent message
+                    for item in content:
+                        if isinstance(item, list):
+                            for msg in item:
+                                if msg.get("type") == "agent_message":
+                                    status = msg.get("status")
+                                    if status == "succeeded":
+                                        return msg.get("content", "")
+                                    elif status == "failed":
+                                        error = msg.get("error", {})
+                                        raise DustAPIError(
+                                            500, error.get("message", "Agent failed")
+                                        )
+
+            delay = interval + random.uniform(0, interval * 0.1)
+            remaining = self.timeout - (time.perf_counter() - start_time)
+            await asyncio.sleep(max(min(delay, remaining), 0))
+            interval = min(interval * self.poll_backoff, self.max_poll_interval)
+
+    async def _parse_sse_stream(self, response: aiohttp.ClientResponse) -> Optional[str]:
         """Parse Server-Sent Events and aggregate tokens.
 
+        Reads one whole event per call and tests line prefixes on bytes, so
+        only data lines are decoded (by orjson, straight from bytes).
+
         Args:
             response: Streaming HTTP response with SSE content.
 
         Returns:
-            Aggregated response text.
+            Aggregated response text, or None if the stream ended before
+            agent_message_success (the answer may be truncated).
         """
         tokens: list[str] = []
 
-        async for line in response.content:
-            line_text = line.decode("utf-8").strip()
-
-            if not line_text or line_text.startswith(":"):
-                continue
+        while True:
+            # One SSE event per read; an empty chunk means the stream has ended
+            try:
+                event = await response.content.readuntil(b"\n\n")
+            except (ValueError, LineTooLong):
+                # Event larger than the read buffer, poll for the answer instead
+                return None
+            if not event:
+                break
+
+            for line in event.split(b"\n"):
+                # Also skips blank lines and ":" keep-alive comments
+                if not line.startswith(b"data: "):
+                    continue
 
-            if line_text.startswith("data: "):
-                data_str = line_text[6:]
-                if data_str == "[DONE]":
-                    break
+                data = line[6:].rstrip(b"\r")
+                if data == b"[DONE]":
+                    return None
 
                 try:
-                    event_data = json.loads(data_str)
+                    event_data = orjson.loads(data)
+                    # Dust wraps each event as {"eventId": ..., "data": {...}}
+                    event_data = event_data.get("data", event_data)
                     event_type = event_data.get("type")
 
                     if event_type == "generation_tokens":
-                        token = event_data.get("text", "")
-                        tokens.append(token)
+                        # Skip chain-of-thought tokens, keep only the answer
+                        if event_data.get("classification", "tokens") == "tokens":
+                            tokens.append(event_data.get("text", ""))
                     elif event_type == "agent_message_success":
                         # Final message, can extract full content if needed
-                        content = event_data.get("content", "")
-                        if content:
-                            return content
-                    elif event_type == "error":
-                        error_msg = event_data.get("message", "Unknown error")
+                        message = event_data.get("message", {})
+                        content = event_data.get("content") or message.get("content", "")
+                        return content or "".join(tokens)
+                    elif event_type in ("error", "agent_error"):
+                        error = event_data.get("error", {})
+                        error_msg = event_data.get("message") or error.get(
+                            "message", "Unknown error"
+                        )
                         raise DustAPIError(500, error_msg)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     continue
 
-        return "".join(tokens)
+        # Dropped or closed without a final message, let the caller poll instead
+        return None
 
     async def health_check(self) -> bool:
         """Check if Dust API is accessible.
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from rag_comparison.clients.base import QueryResult, RAGClient
 
@@ -31,6 +32,7 @@ class GraphRAGClient(RAGClient):
         timeout: float = 60.0,
         default_mode: str = "global",
         default_commune: str = "Rochefort",
+        max_concurrency: int = 8,
     ) -> None:
         """Initialize GraphRAG client.
 
@@ -39,12 +41,16 @@ class GraphRAGClient(RAGClient):
             timeout: Query timeout in seconds.
             default_mode: Query mode ('local' or 'global').
             default_commune: Default commune to query.
+            max_concurrency: Maximum communes queried at once by query_all_communes.
         """
         self.data_path = Path(data_path) if data_path else LAW_DATA_PATH
         self.timeout = timeout
         self.default_mode = default_mode
         self.default_commune = default_commune
+        self.max_concurrency = max_concurrency
         self._rag_instances: dict = {}
+        self._build_locks: dict[str, asyncio.Lock] = {}
+        self._communes_cache: Optional[tuple[float, list[str]]] = None
 
         # Add nano_graphrag to path
         if str(GRAPHRAG_MCP_PATH) not in sys.path:
@@ -54,7 +60,7 @@ class GraphRAGClient(RAGClient):
     def system_name(self) -> str:
         return "graphrag"
 
-    def _get_commune_path(self, commune_id: str) -> Optional[Path]:
+    def _get_commune_path_sync(self, commune_id: str) -> Optional[Path]:
         """Get path to a commune's data directory."""
         commune_path = self.data_path / commune_id
         if commune_path.exists():
@@ -67,14 +73,106 @@ class GraphRAGClient(RAGClient):
 
         return None
 
-    def _list_communes(self) -> list[str]:
-        """List available communes."""
-        if not self.data_path.exists():
+    def _list_communes_sync(self) -> list[str]:
+        """List available communes.
+
+        The directory scan is cached and only repeated when the mtime of
+        the data directory changes (a commune was added or removed).
+        """
+        try:
+            mtime = self.data_path.stat().st_mtime
+        except FileNotFoundError:
             return []
-        return [
-            d.name for d in self.data_path.iterdir()
-            if d.is_dir() and (d / "vdb_entities.json").exists()
-        ]
+
+        if self._communes_cache is not None and self._communes_cache[0] == mtime:
+            return self._communes_cache[1]
+
+        # scandir exposes is_dir() from the directory listing without an extra stat
+        with os.scandir(self.data_path) as entries:
+            communes = [
+                entry.name for entry in entries
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "vdb_entities.json"))
+            ]
+        self._communes_cache = (mtime, communes)
+        return communes
+
+    async def _get_commune_path(self, commune_id: str) -> Optional[Path]:
+        """Get path to a commune's data directory without blocking the loop."""
+        return await asyncio.to_thread(self._get_commune_path_sync, commune_id)
+
+    async def _list_communes(self) -> list[str]:
+        """List available communes without blocking the loop."""
+        return await asyncio.to_thread(self._list_communes_sync)
+
+    def _build_rag(self, commune_path: Path) -> Any:
+        """Construct a GraphRAG instance for a commune's data directory.
+
+        Loading the entity, relationship and graph indices from disk makes
+        this expensive (several seconds per commune).
+        """
+        from nano_graphrag import GraphRAG
+        from nano_graphrag._llm import gpt_4o_mini_complete
+
+        return GraphRAG(
+            working_dir=str(commune_path),
+            best_model_func=gpt_4o_mini_complete,
+            cheap_model_func=gpt_4o_mini_complete,
+        )
+
+    async def _get_rag(self, commune_id: str, commune_path: Path) -> Any:
+        """Get the GraphRAG instance for a commune, building it if needed.
+
+        Construction runs in a worker thread so index loading does not block
+        the event loop. A per-commune lock stops concurrent callers from
+        building the same instance twice.
+        """
+        rag = self._rag_instances.get(commune_id)
+        if rag is not None:
+            return rag
+
+        lock = self._build_locks.setdefault(commune_id, asyncio.Lock())
+        async with lock:
+            if commune_id not in self._rag_instances:
+                self._rag_instances[commune_id] = await asyncio.to_thread(
+                    self._build_rag, commune_path
+                )
+        return self._rag_instances[commune_id]
+
+    async def prewarm(self, communes: Optional[list[str]] = None) -> None:
+        """Load GraphRAG instances ahead of the first query.
+
+        Keeps index loading out of the latency measured for the first
+        question sent to each commune. Communes are loaded concurrently.
+        Failures are logged, not raised: a commune that fails to load here
+        is retried by its first query, which reports the error.
+
+        Args:
+            communes: Communes to load (default: the default commune only).
+        """
+        async def load(commune_id: str) -> None:
+            commune_path = await self._get_commune_path(commune_id)
+            if not commune_path:
+                logger.warning(f"Cannot prewarm unknown commune '{commune_id}'")
+                return
+
+            start_time = time.perf_counter()
+            try:
+                await self._get_rag(commune_id, commune_path)
+            except ImportError:
+                raise
+            except Exception as e:
+                # One bad index must not cancel the other communes' loads
+                logger.warning(f"Failed to prewarm GraphRAG for {commune_id}: {e}")
+                return
+            load_ms = (time.perf_counter() - start_time) * 1000
+            logger.info(f"Loaded GraphRAG for {commune_id} in {load_ms:.0f}ms")
+
+        try:
+            await asyncio.gather(*(load(c) for c in communes or [self.default_commune]))
+        except ImportError as e:
+            logger.warning(f"nano_graphrag not available, skipping prewarm: {e}")
+        except Exception as e:
+            logger.warning(f"GraphRAG prewarm failed: {e}")
 
     async def query(
         self,
@@ -98,27 +196,19 @@ class GraphRAGClient(RAGClient):
 
         try:
             # Import nano_graphrag
-            from nano_graphrag import GraphRAG, QueryParam
-            from nano_graphrag._llm import gpt_4o_mini_complete
+            from nano_graphrag import QueryParam
 
             # Get commune path
-            commune_path = self._get_commune_path(commune_id)
+            commune_path = await self._get_commune_path(commune_id)
             if not commune_path:
-                available = self._list_communes()[:5]
+                available = (await self._list_communes())[:5]
                 return QueryResult.error(
                     f"Commune '{commune_id}' not found. Available: {available}",
                     (time.perf_counter() - start_time) * 1000
                 )
 
             # Create or reuse RAG instance
-            if commune_id not in self._rag_instances:
-                self._rag_instances[commune_id] = GraphRAG(
-                    working_dir=str(commune_path),
-                    best_model_func=gpt_4o_mini_complete,
-                    cheap_model_func=gpt_4o_mini_complete,
-                )
-
-            rag = self._rag_instances[commune_id]
+            rag = await self._get_rag(commune_id, commune_path)
 
             # Query with timeout
             try:
@@ -163,7 +253,9 @@ class GraphRAGClient(RAGClient):
         mode: Optional[str] = None,
         max_communes: int = 10,
     ) -> QueryResult:
-        """Query across multiple communes.
+        """Query across multiple communes concurrently.
+
+        At most max_concurrency commune queries run at the same time.
 
         Args:
             question: The query text.
@@ -176,21 +268,26 @@ class GraphRAGClient(RAGClient):
         start_time = time.perf_counter()
         query_mode = mode or self.default_mode
 
-        communes = self._list_communes()[:max_communes]
+        communes = (await self._list_communes())[:max_communes]
         if not communes:
             return QueryResult.error(
                 "No communes found",
                 (time.perf_counter() - start_time) * 1000
             )
 
-        results = []
-        for commune in communes:
-            result = await self.query(question, mode=query_mode, commune=commune)
-            if result.status == "success":
-                results.append({
-                    "commune": commune,
-                    "answer": result.answer[:500],
-                })
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def query_commune(commune: str) -> QueryResult:
+            async with semaphore:
+                return await self.query(question, mode=query_mode, commune=commune)
+
+        commune_results = await asyncio.gather(*(query_commune(c) for c in communes))
+
+        results = [
+            {"commune": commune, "answer": result.answer[:500]}
+            for commune, result in zip(communes, commune_results)
+            if result.status == "success"
+        ]
 
         latency_ms = (time.perf_counter() - start_time) * 1000
 
@@ -211,8 +308,9 @@ class GraphRAGClient(RAGClient):
 
     async def health_check(self) -> bool:
         """Check if GraphRAG data is accessible."""
-        return self.data_path.exists() and len(self._list_communes()) > 0
+        return len(await self._list_communes()) > 0
 
     async def close(self) -> None:
         """Clean up resources."""
         self._rag_instances.clear()
+        self._build_locks.clear()
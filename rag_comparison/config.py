@@ -3,18 +3,22 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 
 from dotenv import load_dotenv
 
+# .env files already loaded into os.environ (None is the default search path)
+_loaded_dotenv_paths: set[Optional[str]] = set()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ExperimentConfig:
     """Configuration for a comparison experiment.
 
     Loads settings from environment variables or direct instantiation.
     Supports Dust RAG, GraphRAG, OPIK logging, and optional LLM-as-judge.
+    Instances are immutable; use dataclasses.replace() to derive a variant.
     """
 
     # Dust settings
@@ -39,12 +43,15 @@ class ExperimentConfig:
     # Experiment settings
     timeout_seconds: float = 30.0
     parallel_workers: int = 8
-    metrics: list[str] = field(default_factory=lambda: ["contains", "latency", "status"])
+    metrics: tuple[str, ...] = ("contains", "latency", "status")
 
     @classmethod
     def from_env(cls, dotenv_path: Optional[str] = None) -> ExperimentConfig:
         """Load configuration from environment variables.
 
+        Each .env file is read at most once per process; later calls only read
+        os.environ.
+
         Args:
             dotenv_path: Optional path to .env file. If None, searches default locations.
 
@@ -54,7 +61,9 @@ class ExperimentConfig:
         Raises:
             ValueError: If required environment variables are missing.
         """
-        load_dotenv(dotenv_path)
+        if dotenv_path not in _loaded_dotenv_paths:
+            load_dotenv(dotenv_path)
+            _loaded_dotenv_paths.add(dotenv_path)
 
         # Required variables
         dust_api_key = os.getenv("DUST_API_KEY")
@@ -51,11 +51,13 @@ class OPIKError(RAGComparisonError):
     pass
 
 
-class TimeoutError(RAGComparisonError):
+class RAGTimeoutError(RAGComparisonError, TimeoutError):
     """Query timeout error.
 
     Raised when a RAG query exceeds the configured timeout.
     Captures which system timed out and the timeout duration.
+    Also a builtin TimeoutError (which asyncio.TimeoutError aliases), so
+    existing ``except asyncio.TimeoutError`` handlers catch it.
     """
 
     def __init__(self, system: str, timeout_seconds: float) -> None:
@@ -1,7 +1,8 @@
 """Metrics module for RAG comparison evaluation."""
 
+from rag_comparison.metrics.judge_cache import JudgeCache
 from rag_comparison.metrics.latency import LatencyMetric
 from rag_comparison.metrics.llm_judge import LLMPrecisionJudge
 from rag_comparison.metrics.status import StatusMetric
 
-__all__ = ["LatencyMetric", "LLMPrecisionJudge", "StatusMetric"]
+__all__ = ["JudgeCache", "LatencyMetric", "LLMPrecisionJudge", "StatusMetric"]
@@ -0,0 +1,116 @@
+"""Persistent on-disk cache for LLM judge scores."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class JudgeCache:
+    """SQLite-backed cache of judge results keyed by a request hash.
+
+    The judge runs at temperature 0, so re-scoring the same question,
+    expected answer and response with the same model and prompt gives the
+    same result. Caching it makes experiment reruns a disk read per row
+    instead of an API call.
+
+    The cache is best-effort: database errors are logged and treated as a
+    miss or a skipped write, never raised to the caller.
+    """
+
+    def __init__(self, path: str = ".judge_cache.sqlite") -> None:
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file, created on first use.
+        """
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """Build a cache key from the parts that determine a judge result.
+
+        Args:
+            *parts: Model, temperature, prompt and scored texts.
+
+        Returns:
+            Hex SHA-256 digest of the parts serialized as a JSON array.
+        """
+        return hashlib.sha256(orjson.dumps(parts)).hexdigest()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get or open the database connection, creating the table if needed."""
+        if self._conn is None:
+            # Metrics are scored from OPIK's worker threads, access is serialized by _lock
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS judge_cache ("
+                "key TEXT PRIMARY KEY, score REAL, reasoning TEXT, created_at INT)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[tuple[float, str]]:
+        """Look up a cached result.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            Tuple of (score, reasoning), or None on a miss.
+        """
+        try:
+            with self._lock:
+                row = self._get_conn().execute(
+                    "SELECT score, reasoning FROM judge_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Judge cache read failed ({self.path}): {e}")
+            return None
+        return (row[0], row[1]) if row else None
+
+    def put(self, key: str, score: float, reasoning: str) -> None:
+        """Store a result.
+
+        Args:
+            key: Key from make_key().
+            score: Parsed judge score.
+            reasoning: Judge reasoning, before ambiguity flagging.
+        """
+        self.put_many([(key, score, reasoning)])
+
+    def put_many(self, entries: list[tuple[str, float, str]]) -> None:
+        """Store several results in one transaction.
+
+        Args:
+            entries: (key, score, reasoning) tuples.
+        """
+        now = int(time.time())
+        try:
+            with self._lock:
+                conn = self._get_conn()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO judge_cache (key, score, reasoning, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(key, score, reasoning, now) for key, score, reasoning in entries],
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Judge cache write failed ({self.path}): {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
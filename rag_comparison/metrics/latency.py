@@ -64,4 +64,8 @@ class LatencyMetric(BaseMetric):
         Returns:
             ScoreResult with latency value in milliseconds.
         """
-        return self.score(output, latency_ms=latency_ms, **ignored_kwargs)
+        return ScoreResult(
+            name=self._name,
+            value=latency_ms,
+            reason=f"Response time: {latency_ms:.0f}ms",
+        )
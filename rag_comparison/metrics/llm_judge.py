@@ -2,19 +2,52 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import math
 import os
-from typing import Optional
-
-from openai import AsyncOpenAI, OpenAI
+from typing import Any, Optional
+
+import httpx
+import orjson
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 from opik.evaluation.metrics import BaseMetric
 from opik.evaluation.metrics.score_result import ScoreResult
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from rag_comparison.errors import LLMJudgeError
+from rag_comparison.metrics.judge_cache import JudgeCache
 
 logger = logging.getLogger(__name__)
 
+# OpenAI clients shared by all judges, so connections and TLS sessions are
+# reused across instances. Async clients are bound to the loop they run on
+# and are dropped once that loop is closed.
+_SHARED_SYNC: dict[Optional[str], OpenAI] = {}
+_SHARED_ASYNC: dict[tuple[asyncio.AbstractEventLoop, Optional[str]], AsyncOpenAI] = {}
+
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=100, keepalive_expiry=30.0
+)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# The shared clients are built with max_retries=0 so this is the only retry
+# layer, for both the sync and async judge calls.
+_retry_transient = retry(
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, InternalServerError)),
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+
 
 class LLMPrecisionJudge(BaseMetric):
     """LLM-as-judge metric for semantic precision evaluation.
@@ -24,16 +57,19 @@ class LLMPrecisionJudge(BaseMetric):
     completeness, and legal reasoning quality.
     """
 
+    # Both prompts are sent as the first message so OpenAI's prompt cache can
+    # reuse their prefill across calls. Editing either one starts a new prompt
+    # cache and invalidates the JudgeCache entries, as both are in its key.
     JUDGE_PROMPT = """You are a legal precision evaluator. Given a legal question,
-an expected answer, and a RAG system response, score how precisely the response
+an expected answer, and a RAG system response, grade how precisely the response
 answers the question.
 
-Scoring criteria:
-- 1.0: Perfectly accurate, complete, legally sound
-- 0.8-0.9: Mostly accurate with minor omissions
-- 0.5-0.7: Partially correct but missing key information
-- 0.2-0.4: Relevant but contains inaccuracies
-- 0.0-0.1: Incorrect or irrelevant
+Grades:
+- A: Perfectly accurate, complete, legally sound
+- B: Mostly accurate with minor omissions
+- C: Partially correct but missing key information
+- D: Relevant but contains inaccuracies
+- E: Incorrect or irrelevant
 
 Consider:
 1. Factual accuracy of legal information
@@ -41,13 +77,27 @@ Consider:
 3. Quality of legal reasoning
 4. Proper citation of relevant articles/laws
 
-Respond with JSON only: {"score": <0-1>, "reasoning": "<explanation>"}"""
+Output exactly one letter: A, B, C, D or E."""
+
+    EXPLAIN_PROMPT = """You are a legal precision evaluator. Given a legal question,
+an expected answer, and a RAG system response, explain in a few sentences how
+precisely the response answers the question. Cover factual accuracy,
+completeness, quality of legal reasoning and citation of relevant articles/laws."""
+
+    BUCKET_SCORES = {"A": 1.0, "B": 0.8, "C": 0.55, "D": 0.3, "E": 0.05}
+    """Precision score for each grade letter."""
+
+    BATCH_MIN_ROWS = 8
+    """Below this many rows score_batch() calls ascore() instead of the Batch API."""
 
     def __init__(
         self,
         model: str = "gpt-4o-mini",
         api_key: Optional[str] = None,
         temperature: float = 0,
+        max_concurrency: int = 20,
+        cache_path: str = ".judge_cache.sqlite",
+        use_cache: bool = True,
     ) -> None:
         """Initialize the LLM judge.
 
@@ -55,17 +105,20 @@ Respond with JSON only: {"score": <0-1>, "reasoning": "<explanation>"}"""
             model: OpenAI model to use (default: gpt-4o-mini).
             api_key: OpenAI API key (default: from OPENAI_API_KEY env var).
             temperature: Model temperature (default: 0 for deterministic).
+            max_concurrency: Judge requests in flight at once in ascore_many().
+            cache_path: SQLite file caching judge results across runs.
+            use_cache: Whether to read and write the result cache.
         """
         self._name = "llm_precision"
         self.model = model
         self.temperature = temperature
+        self.max_concurrency = max_concurrency
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
 
         if not self.api_key:
             logger.warning("OPENAI_API_KEY not set, LLM judge will fail on use")
 
-        self._sync_client: Optional[OpenAI] = None
-        self._async_client: Optional[AsyncOpenAI] = None
+        self._cache = JudgeCache(cache_path) if use_cache else None
 
     @property
     def name(self) -> str:
@@ -73,16 +126,32 @@ Respond with JSON only: {"score": <0-1>, "reasoning": "<explanation>"}"""
         return self._name
 
     def _get_sync_client(self) -> OpenAI:
-        """Get or create synchronous OpenAI client."""
-        if self._sync_client is None:
-            self._sync_client = OpenAI(api_key=self.api_key)
-        return self._sync_client
+        """Get the shared synchronous OpenAI client for this API key."""
+        client = _SHARED_SYNC.get(self.api_key)
+        if client is None:
+            client = OpenAI(
+                api_key=self.api_key,
+                max_retries=0,
+                http_client=DefaultHttpxClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
+            )
+            _SHARED_SYNC[self.api_key] = client
+        return client
 
     def _get_async_client(self) -> AsyncOpenAI:
-        """Get or create asynchronous OpenAI client."""
-        if self._async_client is None:
-            self._async_client = AsyncOpenAI(api_key=self.api_key)
-        return self._async_client
+        """Get the shared asynchronous OpenAI client for this API key and loop."""
+        key = (asyncio.get_running_loop(), self.api_key)
+        client = _SHARED_ASYNC.get(key)
+        if client is None:
+            # Clients of closed loops (e.g. earlier asyncio.run() calls) can never be used again
+            for stale in [k for k in _SHARED_ASYNC if k[0].is_closed()]:
+                del _SHARED_ASYNC[stale]
+            client = AsyncOpenAI(
+                api_key=self.api_key,
+                max_retries=0,
+                http_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
+            )
+            _SHARED_ASYNC[key] = client
+        return client
 
     def _build_user_prompt(
         self,
@@ -107,45 +176,136 @@ Expected Answer: {expected_text}
 
 RAG Response: {response}"""
 
-    def _parse_response(self, content: str) -> tuple[float, str]:
-        """Parse the judge's JSON response.
+    def _cache_key(
+        self,
+        question: str,
+        expected_answer: Optional[str],
+        response: str,
+    ) -> str:
+        """Build the result cache key for one judgement."""
+        return JudgeCache.make_key(
+            self.model,
+            self.temperature,
+            self.JUDGE_PROMPT,
+            self.EXPLAIN_PROMPT,
+            question,
+            expected_answer,
+            response,
+        )
+
+    def _build_request(
+        self,
+        question: str,
+        expected_answer: Optional[str],
+        response: str,
+    ) -> dict[str, Any]:
+        """Build the chat completion request body for one grading call.
 
         Args:
-            content: Raw response content from the model.
+            question: Original legal question.
+            expected_answer: Expected/reference answer.
+            response: RAG system's response.
 
         Returns:
-            Tuple of (score, reasoning).
+            Keyword arguments for chat.completions.create().
+        """
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self.JUDGE_PROMPT},
+                {
+                    "role": "user",
+                    "content": self._build_user_prompt(question, expected_answer, response),
+                },
+            ],
+            "temperature": self.temperature,
+            "max_tokens": 1,
+            "logprobs": True,
+            "top_logprobs": 5,
+            "extra_body": {"prompt_cache_key": f"judge-{self.model}-v1"},
+        }
+
+    def _build_explain_request(
+        self,
+        question: str,
+        expected_answer: Optional[str],
+        response: str,
+    ) -> dict[str, Any]:
+        """Build the chat completion request body for one explanation call.
+
+        Args:
+            question: Original legal question.
+            expected_answer: Expected/reference answer.
+            response: RAG system's response.
+
+        Returns:
+            Keyword arguments for chat.completions.create().
+        """
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self.EXPLAIN_PROMPT},
+                {
+                    "role": "user",
+                    "content": self._build_user_prompt(question, expected_answer, response),
+                },
+            ],
+            "temperature": self.temperature,
+            "extra_body": {"prompt_cache_key": f"judge-explain-{self.model}-v1"},
+        }
+
+    @staticmethod
+    def _top_logprobs(response: Any) -> list[tuple[str, float]]:
+        """Get the (token, logprob) candidates for the first output token.
+
+        Args:
+            response: Chat completion returned by the OpenAI SDK.
+
+        Returns:
+            Candidate tokens with their log probabilities.
 
         Raises:
-            LLMJudgeError: If parsing fails.
+            LLMJudgeError: If the response carries no logprobs.
         """
-        try:
-            # Try to extract JSON from the response
-            content = content.strip()
+        logprobs = response.choices[0].logprobs
+        if logprobs is None or not logprobs.content:
+            raise LLMJudgeError("Response has no logprobs", response.choices[0].message.content)
+        return [(item.token, item.logprob) for item in logprobs.content[0].top_logprobs]
 
-            # Handle markdown code blocks
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
+    def _parse_response(self, top_logprobs: list[tuple[str, float]]) -> float:
+        """Turn the grade letter distribution into a precision score.
 
-            data = json.loads(content.strip())
-            score = float(data.get("score", 0))
-            reasoning = str(data.get("reasoning", "No reasoning provided"))
+        The score is the expected bucket score under the model's probabilities
+        for the grade letters, renormalized over the letters only, which is
+        smoother than taking the single most likely grade.
 
-            # Validate score range
-            if not 0 <= score <= 1:
-                logger.warning(f"Score {score} out of range, clamping to [0, 1]")
-                score = max(0, min(1, score))
+        Args:
+            top_logprobs: (token, logprob) candidates for the grade token.
 
-            return score, reasoning
+        Returns:
+            Precision score (0-1).
+
+        Raises:
+            LLMJudgeError: If no candidate is a grade letter.
+        """
+        probs: dict[str, float] = {}
+        for token, logprob in top_logprobs:
+            letter = token.strip().upper()
+            if letter in self.BUCKET_SCORES:
+                probs[letter] = probs.get(letter, 0.0) + math.exp(logprob)
+
+        total = sum(probs.values())
+        if not total:
+            raise LLMJudgeError(
+                "No grade letter in response", " ".join(token for token, _ in top_logprobs)
+            )
 
-        except json.JSONDecodeError as e:
-            raise LLMJudgeError(f"Failed to parse JSON: {e}", content)
-        except (KeyError, ValueError) as e:
-            raise LLMJudgeError(f"Invalid response format: {e}", content)
+        return sum(self.BUCKET_SCORES[letter] * p for letter, p in probs.items()) / total
+
+    @staticmethod
+    def _is_ambiguous(score: float) -> bool:
+        """Whether a score is close enough to 0.5 to need an explanation and review."""
+        return 0.4 <= score <= 0.6
 
     def _flag_ambiguous(self, score: float, reasoning: str) -> str:
         """Flag ambiguous scores near 0.5 for human review.
@@ -157,9 +317,69 @@ RAG Response: {response}"""
         Returns:
             Potentially modified reasoning with flag.
         """
-        if 0.4 <= score <= 0.6:
-            return f"[REVIEW RECOMMENDED] {reasoning}"
-        return reasoning
+        return ("[REVIEW RECOMMENDED] " if self._is_ambiguous(score) else "") + reasoning
+
+    @_retry_transient
+    def _create(self, request: dict[str, Any]) -> Any:
+        """Send one judge request, retrying with jittered backoff on transient errors."""
+        return self._get_sync_client().chat.completions.create(**request)
+
+    def _classify(self, question: str, response: str, expected_answer: Optional[str]) -> float:
+        """Grade a response with a single-token call (synchronous)."""
+        completion = self._create(self._build_request(question, expected_answer, response))
+        return self._parse_response(self._top_logprobs(completion))
+
+    def _explain(self, question: str, response: str, expected_answer: Optional[str]) -> str:
+        """Ask the judge for its reasoning on a response (synchronous)."""
+        completion = self._create(
+            self._build_explain_request(question, expected_answer, response)
+        )
+        return completion.choices[0].message.content or "No reasoning provided"
+
+    def _judge(
+        self, question: str, response: str, expected_answer: Optional[str]
+    ) -> tuple[float, str]:
+        """Grade a response, paying for an explanation only if the grade is ambiguous.
+
+        Returns:
+            Tuple of (score, reasoning).
+        """
+        score = self._classify(question, response, expected_answer)
+        if self._is_ambiguous(score):
+            return score, self._explain(question, response, expected_answer)
+        return score, f"auto: bucket score {score:.2f}"
+
+    @_retry_transient
+    async def _acreate(self, request: dict[str, Any]) -> Any:
+        """Send one judge request, retrying with jittered backoff on transient errors."""
+        return await self._get_async_client().chat.completions.create(**request)
+
+    async def _aclassify(
+        self, question: str, response: str, expected_answer: Optional[str]
+    ) -> float:
+        """Grade a response with a single-token call (asynchronous)."""
+        completion = await self._acreate(
+            self._build_request(question, expected_answer, response)
+        )
+        return self._parse_response(self._top_logprobs(completion))
+
+    async def _aexplain(
+        self, question: str, response: str, expected_answer: Optional[str]
+    ) -> str:
+        """Ask the judge for its reasoning on a response (asynchronous)."""
+        completion = await self._acreate(
+            self._build_explain_request(question, expected_answer, response)
+        )
+        return completion.choices[0].message.content or "No reasoning provided"
+
+    async def _ajudge(
+        self, question: str, response: str, expected_answer: Optional[str]
+    ) -> tuple[float, str]:
+        """Async version of _judge()."""
+        score = await self._aclassify(question, response, expected_answer)
+        if self._is_ambiguous(score):
+            return score, await self._aexplain(question, response, expected_answer)
+        return score, f"auto: bucket score {score:.2f}"
 
     def score(
         self,
@@ -186,22 +406,20 @@ RAG Response: {response}"""
                 reason="LLM judge not configured (missing OPENAI_API_KEY)",
             )
 
-        try:
-            client = self._get_sync_client()
-            user_prompt = self._build_user_prompt(input, expected_output, output)
-
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.JUDGE_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self.temperature,
-                response_format={"type": "json_object"},
+        key = self._cache_key(input, expected_output, output)
+        cached = self._cache.get(key) if self._cache else None
+        if cached is not None:
+            score, reasoning = cached
+            return ScoreResult(
+                name=self._name,
+                value=score,
+                reason=self._flag_ambiguous(score, reasoning),
             )
 
-            content = response.choices[0].message.content or ""
-            score, reasoning = self._parse_response(content)
+        try:
+            score, reasoning = self._judge(input, output, expected_output)
+            if self._cache:
+                self._cache.put(key, score, reasoning)
             reasoning = self._flag_ambiguous(score, reasoning)
 
             return ScoreResult(
@@ -245,22 +463,21 @@ RAG Response: {response}"""
                 reason="LLM judge not configured (missing OPENAI_API_KEY)",
             )
 
-        try:
-            client = self._get_async_client()
-            user_prompt = self._build_user_prompt(input, expected_output, output)
-
-            response = await client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.JUDGE_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self.temperature,
-                response_format={"type": "json_object"},
+        # sqlite calls block, keep them off the event loop
+        key = self._cache_key(input, expected_output, output)
+        cached = await asyncio.to_thread(self._cache.get, key) if self._cache else None
+        if cached is not None:
+            score, reasoning = cached
+            return ScoreResult(
+                name=self._name,
+                value=score,
+                reason=self._flag_ambiguous(score, reasoning),
             )
 
-            content = response.choices[0].message.content or ""
-            score, reasoning = self._parse_response(content)
+        try:
+            score, reasoning = await self._ajudge(input, output, expected_output)
+            if self._cache:
+                await asyncio.to_thread(self._cache.put, key, score, reasoning)
             reasoning = self._flag_ambiguous(score, reasoning)
 
             return ScoreResult(
@@ -278,3 +495,217 @@ RAG Response: {response}"""
                 value=0.0,
                 reason=f"Evaluation failed: {str(e)}",
             )
+
+    async def ascore_many(
+        self,
+        rows: list[dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+    ) -> list[ScoreResult]:
+        """Score many RAG responses concurrently.
+
+        Up to max_concurrency judge requests are in flight at once, so the
+        total time is bound by the provider's rate limit rather than by the
+        latency of each call.
+
+        Args:
+            rows: Keyword arguments for ascore() (output, input, expected_output).
+            max_concurrency: Override for the instance's max_concurrency.
+
+        Returns:
+            One ScoreResult per row, in input order. Rows whose evaluation
+            raised get a zero score with the error as reason.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def score_one(row: dict[str, Any]) -> ScoreResult:
+            async with semaphore:
+                return await self.ascore(**row)
+
+        outcomes = await asyncio.gather(
+            *(score_one(row) for row in rows), return_exceptions=True
+        )
+
+        results = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                reason = outcome.message if isinstance(outcome, LLMJudgeError) else str(outcome)
+                outcome = ScoreResult(
+                    name=self._name,
+                    value=0.0,
+                    reason=f"Evaluation failed: {reason}",
+                )
+            results.append(outcome)
+        return results
+
+    async def score_batch(
+        self,
+        rows: list[dict[str, Any]],
+        poll_interval: float = 10.0,
+        max_poll_interval: float = 300.0,
+    ) -> list[ScoreResult]:
+        """Score many RAG responses in one OpenAI Batch API job.
+
+        Batch jobs cost half as much as individual calls but may take up to
+        24 hours to complete, so this suits offline re-scoring of a finished
+        experiment rather than interactive runs. Fewer than BATCH_MIN_ROWS
+        rows are scored with ascore() instead.
+
+        Args:
+            rows: Keyword arguments for ascore() (output, input, expected_output).
+            poll_interval: Initial delay between batch status checks, in seconds.
+            max_poll_interval: Upper bound on the delay between status checks.
+
+        Returns:
+            One ScoreResult per row, in input order.
+
+        Raises:
+            LLMJudgeError: If the batch job fails, expires or is cancelled.
+        """
+        if not self.api_key:
+            return [
+                ScoreResult(
+                    name=self._name,
+                    value=0.0,
+                    reason="LLM judge not configured (missing OPENAI_API_KEY)",
+                )
+                for _ in rows
+            ]
+
+        keys = [
+            self._cache_key(row["input"], row.get("expected_output"), row["output"])
+            for row in rows
+        ]
+        results: list[Optional[ScoreResult]] = [None] * len(rows)
+        if self._cache:
+            cache = self._cache
+            cached = await asyncio.to_thread(lambda: [cache.get(key) for key in keys])
+            for index, hit in enumerate(cached):
+                if hit is not None:
+                    results[index] = ScoreResult(
+                        name=self._name,
+                        value=hit[0],
+                        reason=self._flag_ambiguous(hit[0], hit[1]),
+                    )
+
+        pending = [index for index, result in enumerate(results) if result is None]
+        if len(pending) < self.BATCH_MIN_ROWS:
+            for index in pending:
+                results[index] = await self.ascore(**rows[index])
+            return [result for result in results if result is not None]
+
+        client = self._get_async_client()
+        lines: list[bytes] = []
+        for i in pending:
+            row = rows[i]
+            body = self._build_request(row["input"], row.get("expected_output"), row["output"])
+            # extra_body is an SDK option, batch request bodies carry its fields directly
+            body.update(body.pop("extra_body", {}))
+            lines.append(orjson.dumps({
+                "custom_id": f"row-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }))
+        batch_file = await client.files.create(
+            file=("judge_batch.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info(f"Submitted judge batch {batch.id} ({len(pending)} rows)")
+
+        interval = poll_interval
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, max_poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise LLMJudgeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+        for index in pending:
+            results[index] = ScoreResult(
+                name=self._name, value=0.0, reason="Evaluation failed: no batch output"
+            )
+        judged: dict[int, tuple[float, str]] = {}
+        ambiguous: list[int] = []
+        output = await client.files.content(batch.output_file_id)
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            index = int(record["custom_id"].removeprefix("row-"))
+            response = record.get("response") or {}
+
+            if response.get("status_code") != 200:
+                error = (record.get("error") or {}).get("message", "request failed")
+                results[index] = ScoreResult(
+                    name=self._name,
+                    value=0.0,
+                    reason=f"Evaluation failed: {error}",
+                )
+                continue
+
+            logprobs = response["body"]["choices"][0].get("logprobs") or {}
+            top_logprobs = [
+                (item["token"], item["logprob"])
+                for item in (logprobs.get("content") or [{}])[0].get("top_logprobs", [])
+            ]
+            try:
+                score = self._parse_response(top_logprobs)
+            except LLMJudgeError as e:
+                results[index] = ScoreResult(
+                    name=self._name,
+                    value=0.0,
+                    reason=f"Evaluation failed: {e.message}",
+                )
+                continue
+
+            if self._is_ambiguous(score):
+                ambiguous.append(index)
+            judged[index] = (score, f"auto: bucket score {score:.2f}")
+            results[index] = ScoreResult(
+                name=self._name,
+                value=score,
+                reason=judged[index][1],
+            )
+
+        # Explanations are only requested for the few ambiguous rows, online
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def explain(index: int) -> None:
+            row = rows[index]
+            score = judged[index][0]
+            try:
+                async with semaphore:
+                    reasoning = await self._aexplain(
+                        row["input"], row["output"], row.get("expected_output")
+                    )
+            except Exception as e:
+                # Keep the billed batch score, leave the row uncached so a rerun explains it
+                logger.error(f"LLM judge explanation failed for row {index}: {e}")
+                del judged[index]
+                results[index] = ScoreResult(
+                    name=self._name,
+                    value=score,
+                    reason=self._flag_ambiguous(score, f"auto: bucket score {score:.2f}"),
+                )
+                return
+            judged[index] = (score, reasoning)
+            results[index] = ScoreResult(
+                name=self._name,
+                value=score,
+                reason=self._flag_ambiguous(score, reasoning),
+            )
+
+        await asyncio.gather(*(explain(index) for index in ambiguous))
+
+        if self._cache:
+            await asyncio.to_thread(
+                self._cache.put_many,
+                [(keys[index], score, reasoning) for index, (score, reasoning) in judged.items()],
+            )
+        return [result for result in results if result is not None]
@@ -21,6 +21,8 @@ class StatusMetric(BaseMetric):
             name: Metric name for OPIK logging.
         """
         self._name = name
+        # Every successful row scores the same, so one shared result is reused
+        self._success = ScoreResult(name=name, value=1.0, reason="success")
 
     @property
     def name(self) -> str:
@@ -43,10 +45,11 @@ class StatusMetric(BaseMetric):
         Returns:
             ScoreResult with 1.0 for success, 0.0 otherwise.
         """
-        success = status == "success"
+        if status == "success":
+            return self._success
         return ScoreResult(
             name=self._name,
-            value=1.0 if success else 0.0,
+            value=0.0,
             reason=status,
         )
 
@@ -66,4 +69,11 @@ class StatusMetric(BaseMetric):
         Returns:
             ScoreResult with 1.0 for success, 0.0 otherwise.
         """
-        return self.score(output, status=status, **ignored_kwargs)
+        # Same body as score() rather than a call to it, nothing here awaits
+        if status == "success":
+            return self._success
+        return ScoreResult(
+            name=self._name,
+            value=0.0,
+            reason=status,
+        )
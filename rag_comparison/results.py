@@ -2,11 +2,47 @@
 
 from __future__ import annotations
 
-import statistics
+import io
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
+
+_REPORT_TEMPLATE = """\
+# RAG Comparison Report: {name}
+
+**Date**: {date}
+**Dataset**: {dataset}
+**Questions**: {questions}
+
+---
+
+## Summary
+
+{summary}{dust}{graphrag}---
+
+**OPIK Dashboard**: [{project}]({url})"""
+
+_SYSTEM_TEMPLATE = """\
+## {title}
+
+| Metric | Value |
+|--------|-------|
+| Success Rate | {m.success_rate:.1%} |
+| Avg Latency | {m.avg_latency_ms:.0f}ms |
+| P50 Latency | {m.p50_latency_ms:.0f}ms |
+| P95 Latency | {m.p95_latency_ms:.0f}ms |
+
+"""
+
+_METRIC_SCORES_HEADER = """\
+### Metric Scores
+
+| Metric | Mean | Min | Max |
+|--------|------|-----|-----|
+"""
+
 
 @dataclass
 class SystemMetrics:
@@ -72,33 +108,35 @@ class SystemMetrics:
                 max_latency_ms=0.0,
             )
 
-        sorted_latencies = sorted(latencies)
-        n = len(sorted_latencies)
+        a = np.asarray(latencies, dtype=np.float64)
+        n = a.size
 
-        # Compute percentiles
+        # Compute percentiles, selecting only the two order statistics needed
         p50_idx = int(n * 0.50)
         p95_idx = min(int(n * 0.95), n - 1)
+        partitioned = np.partition(a, [p50_idx, p95_idx])
 
         # Aggregate metric scores
         aggregated_metrics: dict[str, dict[str, float]] = {}
         if metric_scores:
             for name, values in metric_scores.items():
                 if values:
+                    v = np.asarray(values, dtype=np.float64)
                     aggregated_metrics[name] = {
-                        "mean": statistics.mean(values),
-                        "min": min(values),
-                        "max": max(values),
-                        "std": statistics.stdev(values) if len(values) > 1 else 0.0,
+                        "mean": float(v.mean()),
+                        "min": float(v.min()),
+                        "max": float(v.max()),
+                        "std": float(v.std(ddof=1)) if v.size > 1 else 0.0,
                     }
 
         return cls(
             system_name=system_name,
             success_rate=success_count / total_count if total_count > 0 else 0.0,
-            avg_latency_ms=statistics.mean(latencies),
-            p50_latency_ms=sorted_latencies[p50_idx],
-            p95_latency_ms=sorted_latencies[p95_idx],
-            min_latency_ms=min(latencies),
-            max_latency_ms=max(latencies),
+            avg_latency_ms=float(a.mean()),
+            p50_latency_ms=float(partitioned[p50_idx]),
+            p95_latency_ms=float(partitioned[p95_idx]),
+            min_latency_ms=float(a.min()),
+            max_latency_ms=float(a.max()),
             metric_scores=aggregated_metrics,
         )
 
@@ -140,87 +178,51 @@ class ExperimentResult:
         Returns:
             Formatted markdown string.
         """
-        lines = [
-            f"# RAG Comparison Report: {self.experiment_name}",
-            "",
-            f"**Date**: {self.created_at.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"**Dataset**: {self.dataset_name}",
-            f"**Questions**: {self.question_count}",
-            "",
-            "---",
-            "",
-            "## Summary",
-            "",
-        ]
-
-        # Add winner if determined
+        summary = ""
         if self.comparison_summary:
             winner = self.comparison_summary.get("winner", "tie")
             margin = self.comparison_summary.get("margin", "")
             if winner != "tie":
-                lines.append(f"**Winner**: {winner.upper()} ({margin})")
+                summary = f"**Winner**: {winner.upper()} ({margin})\n\n"
             else:
-                lines.append("**Result**: Tie (similar performance)")
-            lines.append("")
-
-        # Dust section
-        lines.extend([
-            "## Dust RAG",
-            "",
-            f"| Metric | Value |",
-            f"|--------|-------|",
-            f"| Success Rate | {self.dust_metrics.success_rate:.1%} |",
-            f"| Avg Latency | {self.dust_metrics.avg_latency_ms:.0f}ms |",
-            f"| P50 Latency | {self.dust_metrics.p50_latency_ms:.0f}ms |",
-            f"| P95 Latency | {self.dust_metrics.p95_latency_ms:.0f}ms |",
-            "",
-        ])
-
-        # Add metric scores for Dust
-        if self.dust_metrics.metric_scores:
-            lines.append("### Metric Scores")
-            lines.append("")
-            lines.append("| Metric | Mean | Min | Max |")
-            lines.append("|--------|------|-----|-----|")
-            for name, stats in self.dust_metrics.metric_scores.items():
-                lines.append(
-                    f"| {name} | {stats['mean']:.3f} | {stats['min']:.3f} | {stats['max']:.3f} |"
-                )
-            lines.append("")
-
-        # GraphRAG section
-        lines.extend([
-            "## GraphRAG",
-            "",
-            f"| Metric | Value |",
-            f"|--------|-------|",
-            f"| Success Rate | {self.graphrag_metrics.success_rate:.1%} |",
-            f"| Avg Latency | {self.graphrag_metrics.avg_latency_ms:.0f}ms |",
-            f"| P50 Latency | {self.graphrag_metrics.p50_latency_ms:.0f}ms |",
-            f"| P95 Latency | {self.graphrag_metrics.p95_latency_ms:.0f}ms |",
-            "",
-        ])
-
-        # Add metric scores for GraphRAG
-        if self.graphrag_metrics.metric_scores:
-            lines.append("### Metric Scores")
-            lines.append("")
-            lines.append("| Metric | Mean | Min | Max |")
-            lines.append("|--------|------|-----|-----|")
-            for name, stats in self.graphrag_metrics.metric_scores.items():
-                lines.append(
-                    f"| {name} | {stats['mean']:.3f} | {stats['min']:.3f} | {stats['max']:.3f} |"
-                )
-            lines.append("")
-
-        # Dashboard link
-        lines.extend([
-            "---",
-            "",
-            f"**OPIK Dashboard**: [{self.opik_project}]({self.get_opik_url()})",
-        ])
-
-        return "\n".join(lines)
+                summary = "**Result**: Tie (similar performance)\n\n"
+
+        return _REPORT_TEMPLATE.format(
+            name=self.experiment_name,
+            date=self.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            dataset=self.dataset_name,
+            questions=self.question_count,
+            summary=summary,
+            dust=self._system_section("Dust RAG", self.dust_metrics),
+            graphrag=self._system_section("GraphRAG", self.graphrag_metrics),
+            project=self.opik_project,
+            url=self.get_opik_url(),
+        )
+
+    @staticmethod
+    def _system_section(title: str, metrics: SystemMetrics) -> str:
+        """Render one system's section of the markdown report.
+
+        Args:
+            title: Section heading.
+            metrics: The system's aggregated metrics.
+
+        Returns:
+            Markdown for the section, ending with a blank line.
+        """
+        section = _SYSTEM_TEMPLATE.format(title=title, m=metrics)
+        if not metrics.metric_scores:
+            return section
+
+        out = io.StringIO()
+        out.write(section)
+        out.write(_METRIC_SCORES_HEADER)
+        for name, stats in metrics.metric_scores.items():
+            out.write(
+                f"| {name} | {stats['mean']:.3f} | {stats['min']:.3f} | {stats['max']:.3f} |\n"
+            )
+        out.write("\n")
+        return out.getvalue()
 
     def get_opik_url(self) -> str:
         """Get the OPIK dashboard URL for this experiment.
@@ -257,19 +259,16 @@ class ExperimentResult:
             graphrag_score += 0.15
 
         # Metric scores comparison (30% weight)
-        dust_metric_avg = 0.0
-        graphrag_metric_avg = 0.0
-        metric_count = 0
-
-        for name in self.dust_metrics.metric_scores:
-            if name in self.graphrag_metrics.metric_scores:
-                dust_metric_avg += self.dust_metrics.metric_scores[name]["mean"]
-                graphrag_metric_avg += self.graphrag_metrics.metric_scores[name]["mean"]
-                metric_count += 1
-
-        if metric_count > 0:
-            dust_metric_avg /= metric_count
-            graphrag_metric_avg /= metric_count
+        dust_scores = self.dust_metrics.metric_scores
+        graphrag_scores = self.graphrag_metrics.metric_scores
+        # Dict order, not a set, so the float sums are the same on every run
+        shared = [name for name in dust_scores if name in graphrag_scores]
+
+        if shared:
+            dust_metric_avg = sum(dust_scores[name]["mean"] for name in shared) / len(shared)
+            graphrag_metric_avg = (
+                sum(graphrag_scores[name]["mean"] for name in shared) / len(shared)
+            )
 
             if dust_metric_avg > graphrag_metric_avg:
                 dust_score += 0.3
@@ -0,0 +1,141 @@
+"""Streaming accumulators for building SystemMetrics without storing every value."""
+
+from __future__ import annotations
+
+import math
+import random
+from typing import Optional
+
+import numpy as np
+
+from rag_comparison.results import SystemMetrics
+
+
+class StatsAccumulator:
+    """Running count, mean, min, max and standard deviation (Welford's algorithm).
+
+    Uses constant memory and is numerically stable, so results can be
+    aggregated as they arrive instead of being collected into lists first.
+    """
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x: float) -> None:
+        """Add one value.
+
+        Args:
+            x: Observed value.
+        """
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation, 0.0 for fewer than two values."""
+        return math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Summary in the SystemMetrics.metric_scores format.
+
+        Returns:
+            Dict with mean, min, max and std.
+        """
+        return {"mean": self.mean, "min": self.min, "max": self.max, "std": self.std}
+
+
+class LatencyAccumulator(StatsAccumulator):
+    """StatsAccumulator that also estimates P50/P95 latencies.
+
+    Percentiles come from a uniform reservoir sample of at most
+    reservoir_size latencies, so they are exact up to that many queries
+    and estimates beyond it.
+    """
+
+    def __init__(self, reservoir_size: int = 10_000, seed: Optional[int] = 0) -> None:
+        """Initialize the accumulator.
+
+        Args:
+            reservoir_size: Maximum number of latencies kept for percentiles.
+            seed: Seed for reservoir sampling, None for nondeterministic.
+        """
+        super().__init__()
+        self.reservoir_size = reservoir_size
+        self._reservoir: list[float] = []
+        self._rng = random.Random(seed)
+
+    def add(self, x: float) -> None:
+        """Add one latency.
+
+        Args:
+            x: Query latency in milliseconds.
+        """
+        super().add(x)
+        if len(self._reservoir) < self.reservoir_size:
+            self._reservoir.append(x)
+        else:
+            j = self._rng.randrange(self.n)
+            if j < self.reservoir_size:
+                self._reservoir[j] = x
+
+    def percentiles(self) -> tuple[float, float]:
+        """P50 and P95 latencies, using the same indices as from_latencies().
+
+        Returns:
+            Tuple of (p50, p95), or (0.0, 0.0) if nothing was added.
+        """
+        if not self._reservoir:
+            return 0.0, 0.0
+        a = np.asarray(self._reservoir, dtype=np.float64)
+        n = a.size
+        p50_idx = int(n * 0.50)
+        p95_idx = min(int(n * 0.95), n - 1)
+        partitioned = np.partition(a, [p50_idx, p95_idx])
+        return float(partitioned[p50_idx]), float(partitioned[p95_idx])
+
+    def finalize(
+        self,
+        system_name: str,
+        success_count: int,
+        total_count: int,
+        metric_scores: Optional[dict[str, StatsAccumulator]] = None,
+    ) -> SystemMetrics:
+        """Build SystemMetrics from the accumulated values.
+
+        Streaming counterpart of SystemMetrics.from_latencies().
+
+        Args:
+            system_name: System identifier.
+            success_count: Number of successful queries.
+            total_count: Total number of queries.
+            metric_scores: Optional per-metric score accumulators.
+
+        Returns:
+            Computed SystemMetrics instance.
+        """
+        if not self.n:
+            return SystemMetrics.from_latencies(system_name, [], success_count, total_count)
+
+        p50, p95 = self.percentiles()
+        return SystemMetrics(
+            system_name=system_name,
+            success_rate=success_count / total_count if total_count > 0 else 0.0,
+            avg_latency_ms=self.mean,
+            p50_latency_ms=p50,
+            p95_latency_ms=p95,
+            min_latency_ms=self.min,
+            max_latency_ms=self.max,
+            metric_scores={
+                name: acc.stats() for name, acc in (metric_scores or {}).items() if acc.n
+            },
+        )
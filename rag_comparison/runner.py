@@ -4,22 +4,27 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Coroutine, Optional, TypeVar
 
 import opik
 from opik.evaluation import evaluate
 from opik.evaluation.metrics import BaseMetric, Contains
 
+from rag_comparison.clients._http import close_shared_sessions, configure_pool
 from rag_comparison.clients.base import QueryResult, RAGClient
 from rag_comparison.config import ExperimentConfig
 from rag_comparison.metrics.latency import LatencyMetric
 from rag_comparison.metrics.llm_judge import LLMPrecisionJudge
 from rag_comparison.metrics.status import StatusMetric
+from rag_comparison.results_accum import LatencyAccumulator, StatsAccumulator
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 @dataclass
 class ComparisonResult:
@@ -57,20 +62,77 @@ class ExperimentRunner:
         self.graphrag_client = graphrag_client
         self.config = config
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        configure_pool(config.parallel_workers)
 
         # Configure OPIK
         opik.configure(api_key=config.opik_api_key)
         self._client = opik.Opik()
 
     def _get_loop(self) -> asyncio.AbstractEventLoop:
-        """Get or create event loop for async operations."""
-        try:
-            return asyncio.get_running_loop()
-        except RuntimeError:
+        """Get or start the background event loop shared by all task calls.
+
+        OPIK evaluate() calls tasks synchronously from worker threads. Running
+        every query on one long-lived loop avoids per-item loop setup and keeps
+        client sessions bound to a loop that stays open between queries.
+        """
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            return loop
+
+        # evaluate() calls tasks from many threads at once, only one may start the loop
+        with self._loop_lock:
             if self._loop is None or self._loop.is_closed():
                 self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="rag-comparison-loop",
+                    daemon=True,
+                )
+                self._loop_thread.start()
             return self._loop
 
+    def _run_coroutine(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the background loop and wait for its result.
+
+        Args:
+            coro: Coroutine to execute.
+
+        Returns:
+            The coroutine's return value.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+
+    def close(self) -> None:
+        """Close both clients, the shared HTTP sessions and the background loop.
+
+        Safe to call more than once.
+        """
+        with self._loop_lock:
+            loop, loop_thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+        if loop is None or loop.is_closed():
+            return
+
+        def run(coro: Coroutine[Any, Any, T]) -> T:
+            return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+        for client in (self.dust_client, self.graphrag_client):
+            close = getattr(client, "close", None)
+            if close is not None:
+                try:
+                    run(close())
+                except Exception as e:
+                    logger.warning(f"Failed to close {client.system_name} client: {e}")
+        run(close_shared_sessions())
+
+        loop.call_soon_threadsafe(loop.stop)
+        if loop_thread is not None:
+            loop_thread.join()
+        loop.close()
+
     def _get_metrics(self) -> list[BaseMetric]:
         """Get list of metrics based on configuration.
 
@@ -115,14 +177,9 @@ class ExperimentRunner:
             question = input_data.get("question", "") if isinstance(input_data, dict) else str(input_data)
             expected = expected_data.get("answer", "") if isinstance(expected_data, dict) else str(expected_data)
 
-            # Run async query in a new event loop
+            # Run async query on the shared background loop
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    result = loop.run_until_complete(client.query(question))
-                finally:
-                    loop.close()
+                result = self._run_coroutine(client.query(question))
             except Exception as e:
                 result = QueryResult.error(str(e))
 
@@ -188,6 +245,8 @@ class ExperimentRunner:
             nb_samples=sample_size,
             experiment_config={"system": "dust", "base_experiment": experiment_name},
             verbose=1,
+            # Match the shared connection pool so queries never queue for a connection
+            task_threads=self.config.parallel_workers,
         )
 
         # Run GraphRAG experiment
@@ -202,6 +261,8 @@ class ExperimentRunner:
             nb_samples=sample_size,
             experiment_config={"system": "graphrag", "base_experiment": experiment_name},
             verbose=1,
+            # Match the shared connection pool so queries never queue for a connection
+            task_threads=self.config.parallel_workers,
         )
 
         # Build summary
@@ -230,57 +291,55 @@ class ExperimentRunner:
         Returns:
             Dictionary with aggregated statistics.
         """
-        # Extract metrics from evaluation results
-        dust_scores: dict[str, list] = {}
-        graphrag_scores: dict[str, list] = {}
-
-        def extract_scores(result: Any, scores_dict: dict[str, list]) -> None:
-            """Extract scores from OPIK EvaluationResult."""
+        # Aggregate scores from evaluation results as they are read
+        dust_scores: dict[str, StatsAccumulator] = {}
+        graphrag_scores: dict[str, StatsAccumulator] = {}
+        dust_latency = LatencyAccumulator()
+        graphrag_latency = LatencyAccumulator()
+
+        def extract_scores(
+            result: Any, scores_dict: dict[str, StatsAccumulator], latency: LatencyAccumulator
+        ) -> None:
+            """Feed scores from an OPIK EvaluationResult into the accumulators."""
             if not hasattr(result, 'test_results'):
                 return
             for test_result in result.test_results:
                 if not hasattr(test_result, 'score_results'):
                     continue
                 for score in test_result.score_results:
-                    name = score.name
-                    if name not in scores_dict:
-                        scores_dict[name] = []
-                    scores_dict[name].append(score.value)
+                    if score.name == "latency_ms":
+                        latency.add(score.value)
+                        continue
+                    if score.name not in scores_dict:
+                        scores_dict[score.name] = StatsAccumulator()
+                    scores_dict[score.name].add(score.value)
 
         try:
-            extract_scores(dust_result, dust_scores)
-            extract_scores(graphrag_result, graphrag_scores)
+            extract_scores(dust_result, dust_scores, dust_latency)
+            extract_scores(graphrag_result, graphrag_scores, graphrag_latency)
         except Exception as e:
             logger.warning(f"Could not extract detailed scores: {e}")
 
-        # Calculate averages
-        def avg(values: list) -> float:
-            return sum(values) / len(values) if values else 0.0
-
-        dust_latencies = dust_scores.get("latency_ms", [])
-        graphrag_latencies = graphrag_scores.get("latency_ms", [])
-        dust_status = dust_scores.get("status", [])
-        graphrag_status = graphrag_scores.get("status", [])
-        dust_precision = dust_scores.get("llm_precision", [])
-        graphrag_precision = graphrag_scores.get("llm_precision", [])
+        def system_summary(
+            scores: dict[str, StatsAccumulator], latency: LatencyAccumulator
+        ) -> dict[str, float]:
+            """Summarize one system's accumulated scores."""
+            p50, p95 = latency.percentiles()
+            return {
+                "success_rate": scores.get("status", StatsAccumulator()).mean,
+                "avg_latency_ms": latency.mean,
+                "p50_latency_ms": p50,
+                "p95_latency_ms": p95,
+                "min_latency_ms": latency.min if latency.n else 0,
+                "max_latency_ms": latency.max if latency.n else 0,
+                "llm_precision": scores.get("llm_precision", StatsAccumulator()).mean,
+            }
 
         return {
             "experiment_name": experiment_name,
             "dust_experiment": f"{experiment_name}_dust",
             "graphrag_experiment": f"{experiment_name}_graphrag",
-            "dust": {
-                "success_rate": avg(dust_status),
-                "avg_latency_ms": avg(dust_latencies),
-                "min_latency_ms": min(dust_latencies) if dust_latencies else 0,
-                "max_latency_ms": max(dust_latencies) if dust_latencies else 0,
-                "llm_precision": avg(dust_precision),
-            },
-            "graphrag": {
-                "success_rate": avg(graphrag_status),
-                "avg_latency_ms": avg(graphrag_latencies),
-                "min_latency_ms": min(graphrag_latencies) if graphrag_latencies else 0,
-                "max_latency_ms": max(graphrag_latencies) if graphrag_latencies else 0,
-                "llm_precision": avg(graphrag_precision),
-            },
+            "dust": system_summary(dust_scores, dust_latency),
+            "graphrag": system_summary(graphrag_scores, graphrag_latency),
             "opik_dashboard": f"https://www.comet.com/opik/{self.config.opik_project_name}",
         }
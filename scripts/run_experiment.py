@@ -14,6 +14,7 @@ import asyncio
 import json
 import logging
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -177,12 +178,13 @@ async def run_experiment(args: argparse.Namespace) -> dict:
 
     # Override config from CLI args
     if args.enable_llm_judge:
-        config.enable_llm_judge = True
-        if "llm_precision" not in config.metrics:
-            config.metrics.append("llm_precision")
+        metrics = config.metrics
+        if "llm_precision" not in metrics:
+            metrics = (*metrics, "llm_precision")
+        config = replace(config, enable_llm_judge=True, metrics=metrics)
 
     if args.metrics:
-        config.metrics = [m.strip() for m in args.metrics.split(",")]
+        config = replace(config, metrics=tuple(m.strip() for m in args.metrics.split(",")))
 
     # Validate configuration
     warnings = config.validate()
@@ -213,6 +215,7 @@ async def run_experiment(args: argparse.Namespace) -> dict:
     )
 
     try:
+        await graphrag_client.prewarm()
         results = await runner.run_experiment(
             dataset_name=args.dataset,
             experiment_name=args.name,
@@ -220,9 +223,8 @@ async def run_experiment(args: argparse.Namespace) -> dict:
         )
         return results
     finally:
-        # Clean up
-        await dust_client.close()
-        await graphrag_client.close()
+        # Clean up clients and the runner's background event loop
+        runner.close()
 
 
 def main() -> None:
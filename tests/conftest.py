@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock
 
@@ -121,8 +122,7 @@ def test_config() -> ExperimentConfig:
 @pytest.fixture
 def test_config_with_llm_judge(test_config: ExperimentConfig) -> ExperimentConfig:
     """Test configuration with LLM judge enabled."""
-    test_config.enable_llm_judge = True
-    return test_config
+    return replace(test_config, enable_llm_judge=True)
 
 
 # Async fixtures
@@ -0,0 +1,187 @@
+"""Tests for the Dust client's SSE streaming and polling fallback."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator, Optional
+from unittest.mock import Mock
+
+import aiohttp
+import orjson
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from rag_comparison.clients._http import close_shared_sessions
+from rag_comparison.clients.dust_client import DustClient
+from rag_comparison.errors import DustAPIError
+
+
+def sse_event(data: dict[str, Any]) -> bytes:
+    """Frame one Dust event the way the events endpoint sends it."""
+    return b"data: " + orjson.dumps({"eventId": "evt", "data": data}) + b"\n\n"
+
+
+def tokens_event(text: str, classification: str = "tokens") -> bytes:
+    return sse_event({"type": "generation_tokens", "text": text, "classification": classification})
+
+
+def success_event(content: str) -> bytes:
+    return sse_event({"type": "agent_message_success", "message": {"content": content}})
+
+
+async def parse(client: DustClient, *chunks: bytes, limit: int = 2**16) -> Optional[str]:
+    """Feed chunks through a real aiohttp StreamReader into _parse_sse_stream."""
+    reader = aiohttp.StreamReader(
+        Mock(_reading_paused=False), limit, loop=asyncio.get_running_loop()
+    )
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    return await client._parse_sse_stream(SimpleNamespace(content=reader))
+
+
+@pytest.fixture
+def dust_client() -> DustClient:
+    return DustClient(api_key="test-key", workspace_id="test-workspace", timeout=5.0)
+
+
+class TestParseSSEStream:
+    """Tests for _parse_sse_stream()."""
+
+    async def test_returns_final_message_content(self, dust_client: DustClient) -> None:
+        answer = await parse(dust_client, tokens_event("Bon"), success_event("Bonjour"))
+        assert answer == "Bonjour"
+
+    async def test_falls_back_to_answer_tokens(self, dust_client: DustClient) -> None:
+        answer = await parse(
+            dust_client,
+            b": keep-alive\n\n",
+            tokens_event("Bon"),
+            tokens_event("thinking", classification="chain_of_thought"),
+            tokens_event("jour"),
+            success_event(""),
+        )
+        assert answer == "Bonjour"
+
+    async def test_event_split_across_chunks(self, dust_client: DustClient) -> None:
+        event = success_event("Bonjour")
+        answer = await parse(dust_client, event[:10], event[10:])
+        assert answer == "Bonjour"
+
+    async def test_unwrapped_event_and_crlf(self, dust_client: DustClient) -> None:
+        event = orjson.dumps({"type": "agent_message_success", "content": "Bonjour"})
+        answer = await parse(dust_client, b"data: " + event + b"\r\n\n")
+        assert answer == "Bonjour"
+
+    async def test_skips_malformed_data(self, dust_client: DustClient) -> None:
+        answer = await parse(dust_client, b"data: {not json\n\n", success_event("Bonjour"))
+        assert answer == "Bonjour"
+
+    async def test_eof_without_final_event_returns_none(self, dust_client: DustClient) -> None:
+        assert await parse(dust_client, tokens_event("Part")) is None
+
+    async def test_done_without_final_event_returns_none(self, dust_client: DustClient) -> None:
+        assert await parse(dust_client, tokens_event("Part"), b"data: [DONE]\n\n") is None
+
+    async def test_oversized_event_returns_none(self, dust_client: DustClient) -> None:
+        # Larger than the reader's high-water mark (twice the limit)
+        assert await parse(dust_client, success_event("x" * 200_000), limit=2**16) is None
+
+    async def test_error_event_raises(self, dust_client: DustClient) -> None:
+        event = sse_event({"type": "agent_error", "error": {"message": "boom"}})
+        with pytest.raises(DustAPIError, match="boom"):
+            await parse(dust_client, tokens_event("Part"), event)
+
+
+# Fake Dust API for end-to-end query() tests
+
+
+class FakeDust:
+    """Serves the Dust conversation endpoints used by DustClient.query()."""
+
+    def __init__(self, events_status: int = 200, events_body: bytes = b"") -> None:
+        self.events_status = events_status
+        self.events_body = events_body
+        self.polls = 0
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        base = "/w/test-workspace/assistant/conversations"
+        app.router.add_post(base, self.create)
+        app.router.add_get(base + "/conv1", self.poll)
+        app.router.add_get(base + "/conv1/messages/msg1/events", self.events)
+        return app
+
+    async def create(self, request: web.Request) -> web.Response:
+        conversation = {
+            "sId": "conv1",
+            "content": [[{"type": "agent_message", "sId": "msg1", "status": "created"}]],
+        }
+        return web.json_response({"conversation": conversation})
+
+    async def events(self, request: web.Request) -> web.StreamResponse:
+        if self.events_status != 200:
+            return web.Response(status=self.events_status)
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        await response.write(self.events_body)
+        return response
+
+    async def poll(self, request: web.Request) -> web.Response:
+        self.polls += 1
+        message = {"type": "agent_message", "status": "succeeded", "content": "Polled answer"}
+        return web.json_response({"conversation": {"content": [[message]]}})
+
+
+@pytest.fixture
+async def serve(dust_client: DustClient) -> AsyncGenerator[Any, None]:
+    """Start a FakeDust server and point dust_client at it."""
+    servers: list[TestServer] = []
+
+    async def start(fake: FakeDust) -> FakeDust:
+        server = TestServer(fake.app())
+        await server.start_server()
+        servers.append(server)
+        dust_client.BASE_URL = str(server.make_url("")).rstrip("/")
+        return fake
+
+    yield start
+    await close_shared_sessions()
+    for server in servers:
+        await server.close()
+
+
+class TestQueryStreaming:
+    """Tests for query() choosing between streaming and polling."""
+
+    async def test_streams_answer(self, dust_client: DustClient, serve: Any) -> None:
+        fake = await serve(FakeDust(events_body=tokens_event("Str") + success_event("Streamed")))
+        result = await dust_client.query("Question?")
+        assert result.status == "success"
+        assert result.answer == "Streamed"
+        assert fake.polls == 0
+
+    @pytest.mark.parametrize("status", [404, 406])
+    async def test_unavailable_events_fall_back_to_polling(
+        self, dust_client: DustClient, serve: Any, status: int
+    ) -> None:
+        fake = await serve(FakeDust(events_status=status))
+        result = await dust_client.query("Question?")
+        assert result.status == "success"
+        assert result.answer == "Polled answer"
+        assert fake.polls == 1
+
+    async def test_truncated_stream_falls_back_to_polling(
+        self, dust_client: DustClient, serve: Any
+    ) -> None:
+        fake = await serve(FakeDust(events_body=tokens_event("Part")))
+        result = await dust_client.query("Question?")
+        assert result.answer == "Polled answer"
+        assert fake.polls == 1
+
+    async def test_events_error_status_raises(self, dust_client: DustClient, serve: Any) -> None:
+        await serve(FakeDust(events_status=500))
+        with pytest.raises(DustAPIError):
+            await dust_client.query("Question?")
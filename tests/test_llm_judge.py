@@ -0,0 +1,245 @@
+"""Tests for the LLM precision judge scoring, batch and cache paths."""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Iterator, Optional
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+
+from rag_comparison.errors import LLMJudgeError
+from rag_comparison.metrics.llm_judge import LLMPrecisionJudge
+
+# Grade candidates served by the fake API, keyed by the RAG response being judged
+GRADES: dict[str, list[tuple[str, float]]] = {
+    "correct": [("A", math.log(0.9)), (" B", math.log(0.1))],
+    "partial": [("C", 0.0)],
+    "rambling": [("The", 0.0), ("I", -1.0)],
+}
+
+
+def completion(
+    content: Optional[str] = None, top_logprobs: Optional[list[tuple[str, float]]] = None
+) -> SimpleNamespace:
+    """Build a chat completion shaped like the OpenAI SDK's."""
+    logprobs = None
+    if top_logprobs is not None:
+        candidates = [SimpleNamespace(token=t, logprob=lp) for t, lp in top_logprobs]
+        logprobs = SimpleNamespace(content=[SimpleNamespace(top_logprobs=candidates)])
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message, logprobs=logprobs)])
+
+
+class FakeAsyncOpenAI:
+    """AsyncOpenAI stand-in serving chat completions and one batch job."""
+
+    def __init__(self, failed_rows: dict[int, str], missing_rows: set[int]) -> None:
+        self.failed_rows = failed_rows
+        self.missing_rows = missing_rows
+        self.output = b""
+        self.chat = SimpleNamespace(
+            completions=SimpleNamespace(create=AsyncMock(side_effect=self._create))
+        )
+        self.files = SimpleNamespace(
+            create=AsyncMock(side_effect=self._upload),
+            content=AsyncMock(side_effect=lambda file_id: SimpleNamespace(content=self.output)),
+        )
+        self.batches = SimpleNamespace(
+            create=AsyncMock(return_value=SimpleNamespace(id="batch-1", status="validating")),
+            retrieve=AsyncMock(return_value=SimpleNamespace(
+                id="batch-1", status="completed", output_file_id="file-out"
+            )),
+        )
+
+    @staticmethod
+    def _grades(messages: list[dict[str, str]]) -> list[tuple[str, float]]:
+        prompt = messages[-1]["content"]
+        return next(grades for text, grades in GRADES.items() if prompt.endswith(f": {text}"))
+
+    async def _create(self, **request: Any) -> SimpleNamespace:
+        if request.get("logprobs"):
+            return completion("A", self._grades(request["messages"]))
+        return completion("Partly correct.")
+
+    async def _upload(self, file: tuple[str, bytes], purpose: str) -> SimpleNamespace:
+        records = []
+        for line in file[1].splitlines():
+            request = orjson.loads(line)
+            index = int(request["custom_id"].removeprefix("row-"))
+            if index in self.missing_rows:
+                continue
+            if index in self.failed_rows:
+                records.append({
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": 500, "body": {}},
+                    "error": {"message": self.failed_rows[index]},
+                })
+                continue
+            grades = self._grades(request["body"]["messages"])
+            top_logprobs = [{"token": t, "logprob": lp} for t, lp in grades]
+            choice = {"logprobs": {"content": [{"top_logprobs": top_logprobs}]}}
+            records.append({
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": {"choices": [choice]}},
+            })
+        self.output = b"\n".join(orjson.dumps(record) for record in records)
+        return SimpleNamespace(id="file-in")
+
+
+@pytest.fixture
+def judge(tmp_path: Path) -> Iterator[LLMPrecisionJudge]:
+    judge = LLMPrecisionJudge(api_key="test-key", cache_path=str(tmp_path / "judge.sqlite"))
+    yield judge
+    if judge._cache:
+        judge._cache.close()
+
+
+def make_row(output: str, question: int = 0) -> dict[str, Any]:
+    return {"input": f"Question {question}?", "output": output, "expected_output": "Reference"}
+
+
+class TestParseResponse:
+    """Tests for _parse_response()."""
+
+    def test_renormalizes_over_grade_letters(self, judge: LLMPrecisionJudge) -> None:
+        top_logprobs = [
+            ("B", math.log(0.7)),
+            ("A", math.log(0.2)),
+            (" b", math.log(0.05)),
+            ("The", math.log(0.05)),
+        ]
+        expected = (0.75 * 0.8 + 0.2 * 1.0) / 0.95
+        assert judge._parse_response(top_logprobs) == pytest.approx(expected)
+
+    def test_single_letter(self, judge: LLMPrecisionJudge) -> None:
+        assert judge._parse_response([("E", 0.0)]) == pytest.approx(0.05)
+
+    @pytest.mark.parametrize("top_logprobs", [[], [("The", 0.0), ("AB", -1.0)]])
+    def test_no_grade_letter_raises(
+        self, judge: LLMPrecisionJudge, top_logprobs: list[tuple[str, float]]
+    ) -> None:
+        with pytest.raises(LLMJudgeError, match="No grade letter"):
+            judge._parse_response(top_logprobs)
+
+    def test_missing_logprobs_raises(self, judge: LLMPrecisionJudge) -> None:
+        with pytest.raises(LLMJudgeError, match="no logprobs"):
+            judge._top_logprobs(completion("A"))
+
+
+class TestAscore:
+    """Tests for ascore() with a mocked AsyncOpenAI client."""
+
+    async def test_scores_and_caches(
+        self, judge: LLMPrecisionJudge, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        client = FakeAsyncOpenAI({}, set())
+        monkeypatch.setattr(judge, "_get_async_client", lambda: client)
+
+        first = await judge.ascore(**make_row("correct"))
+        second = await judge.ascore(**make_row("correct"))
+
+        assert first.value == pytest.approx(0.98)
+        assert first.reason == "auto: bucket score 0.98"
+        assert (second.value, second.reason) == (first.value, first.reason)
+        assert client.chat.completions.create.await_count == 1
+
+    async def test_ambiguous_score_is_explained(
+        self, judge: LLMPrecisionJudge, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        client = FakeAsyncOpenAI({}, set())
+        monkeypatch.setattr(judge, "_get_async_client", lambda: client)
+
+        result = await judge.ascore(**make_row("partial"))
+
+        assert result.value == pytest.approx(0.55)
+        assert result.reason == "[REVIEW RECOMMENDED] Partly correct."
+
+    async def test_no_grade_letter_raises(
+        self, judge: LLMPrecisionJudge, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(judge, "_get_async_client", lambda: FakeAsyncOpenAI({}, set()))
+        with pytest.raises(LLMJudgeError, match="No grade letter"):
+            await judge.ascore(**make_row("rambling"))
+
+
+class TestScoreBatch:
+    """Tests for score_batch() with a mocked AsyncOpenAI client."""
+
+    @pytest.fixture
+    def rows(self) -> list[dict[str, Any]]:
+        outputs = ["correct"] * 6 + ["partial", "rambling", "correct", "correct"]
+        return [make_row(output, question=i) for i, output in enumerate(outputs)]
+
+    async def test_batch_results_and_rerun_from_cache(
+        self,
+        judge: LLMPrecisionJudge,
+        rows: list[dict[str, Any]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        client = FakeAsyncOpenAI(failed_rows={8: "server error"}, missing_rows={9})
+        monkeypatch.setattr(judge, "_get_async_client", lambda: client)
+
+        results = await judge.score_batch(rows, poll_interval=0)
+
+        assert len(results) == len(rows)
+        for result in results[:6]:
+            assert result.value == pytest.approx(0.98)
+            assert result.reason == "auto: bucket score 0.98"
+        assert results[6].value == pytest.approx(0.55)
+        assert results[6].reason == "[REVIEW RECOMMENDED] Partly correct."
+        assert results[7].value == 0.0
+        assert results[7].reason == "Evaluation failed: No grade letter in response"
+        assert results[8].value == 0.0
+        assert results[8].reason == "Evaluation failed: server error"
+        assert results[9].value == 0.0
+        assert results[9].reason == "Evaluation failed: no batch output"
+        assert client.files.create.await_count == 1
+        assert client.batches.retrieve.await_count == 1
+        # Only the ambiguous row needs an online explanation call
+        assert client.chat.completions.create.await_count == 1
+
+        # Rerun: judged rows come from the cache, the three failed rows are
+        # too few for a new batch and are scored online
+        rerun_client = FakeAsyncOpenAI({}, set())
+        monkeypatch.setattr(judge, "_get_async_client", lambda: rerun_client)
+        for i in (7, 8, 9):
+            rows[i] = make_row("correct", question=i)
+
+        rerun = await judge.score_batch(rows, poll_interval=0)
+
+        assert rerun_client.files.create.await_count == 0
+        assert rerun_client.chat.completions.create.await_count == 3
+        for before, after in zip(results[:7], rerun[:7]):
+            assert (after.value, after.reason) == (before.value, before.reason)
+        for result in rerun[7:]:
+            assert result.value == pytest.approx(0.98)
+
+    async def test_few_rows_skip_batch(
+        self, judge: LLMPrecisionJudge, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        client = FakeAsyncOpenAI({}, set())
+        monkeypatch.setattr(judge, "_get_async_client", lambda: client)
+
+        results = await judge.score_batch([make_row("correct", question=i) for i in range(3)])
+
+        assert [r.value for r in results] == pytest.approx([0.98] * 3)
+        assert client.files.create.await_count == 0
+
+    async def test_failed_batch_raises(
+        self,
+        judge: LLMPrecisionJudge,
+        rows: list[dict[str, Any]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        client = FakeAsyncOpenAI({}, set())
+        client.batches.retrieve.return_value = SimpleNamespace(
+            id="batch-1", status="failed", output_file_id=None
+        )
+        monkeypatch.setattr(judge, "_get_async_client", lambda: client)
+
+        with pytest.raises(LLMJudgeError, match="failed"):
+            await judge.score_batch(rows, poll_interval=0)
@@ -0,0 +1,57 @@
+"""Tests for streaming result accumulators."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from rag_comparison.results import SystemMetrics
+from rag_comparison.results_accum import LatencyAccumulator, StatsAccumulator
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 100, 999])
+def test_finalize_matches_from_latencies(n: int) -> None:
+    """Below reservoir_size, finalize() gives the same metrics as from_latencies()."""
+    rng = random.Random(n)
+    latencies = [rng.uniform(10, 5000) for _ in range(n)]
+    scores = [rng.random() for _ in range(n)]
+
+    latency_acc = LatencyAccumulator(reservoir_size=1000)
+    score_acc = StatsAccumulator()
+    for latency, score in zip(latencies, scores):
+        latency_acc.add(latency)
+        score_acc.add(score)
+
+    streamed = latency_acc.finalize("dust", n - 1, n, {"contains": score_acc})
+    expected = SystemMetrics.from_latencies("dust", latencies, n - 1, n, {"contains": scores})
+
+    assert streamed.success_rate == expected.success_rate
+    assert streamed.avg_latency_ms == pytest.approx(expected.avg_latency_ms)
+    assert streamed.p50_latency_ms == expected.p50_latency_ms
+    assert streamed.p95_latency_ms == expected.p95_latency_ms
+    assert streamed.min_latency_ms == expected.min_latency_ms
+    assert streamed.max_latency_ms == expected.max_latency_ms
+    assert streamed.metric_scores.keys() == expected.metric_scores.keys()
+    for key, value in expected.metric_scores["contains"].items():
+        assert streamed.metric_scores["contains"][key] == pytest.approx(value)
+
+
+def test_finalize_empty() -> None:
+    """An empty accumulator gives the same zeroed metrics as from_latencies()."""
+    assert LatencyAccumulator().finalize("graphrag", 0, 3) == SystemMetrics.from_latencies(
+        "graphrag", [], 0, 3
+    )
+
+
+def test_reservoir_is_bounded() -> None:
+    """Past reservoir_size, memory stays bounded and exact stats are still tracked."""
+    acc = LatencyAccumulator(reservoir_size=50)
+    for x in range(1000):
+        acc.add(float(x))
+
+    assert len(acc._reservoir) == 50
+    assert acc.n == 1000
+    assert acc.min == 0.0
+    assert acc.max == 999.0
+    assert acc.mean == pytest.approx(499.5)